@@ -22,7 +22,13 @@ import threading
 import math
 import re
 import os
+import sys
 import json
+import functools
+import hashlib
+import queue
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
@@ -33,6 +39,9 @@ from PIL import Image, ImageGrab
 import mss
 import easyocr
 from pynput import mouse, keyboard
+import win32gui
+import requests
+import deep_translator.google
 from deep_translator import GoogleTranslator
 from openai import OpenAI
 try:
@@ -42,6 +51,33 @@ try:
     TTS_AVAILABLE = True
 except Exception:
     TTS_AVAILABLE = False
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+
+class _PooledRequests:
+    """Stands in for `requests` inside deep_translator: get() goes through one keep-alive Session."""
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def get(self, *args, **kwargs):
+        return self._session.get(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+# GoogleTranslator calls requests.get() per translation (new TCP+TLS handshake each time);
+# route it through a shared Session so consecutive lookups reuse the warm connection
+HTTP_SESSION = requests.Session()
+deep_translator.google.requests = _PooledRequests(HTTP_SESSION)
+
+
+_get_cursor_pos = win32gui.GetCursorPos  # bound once; called on every trigger
 
 
 # ---------------- Configuration ---------------- #
@@ -59,10 +95,12 @@ TARGET_LANG      = "tr"
 TARGET_LANG_NAME = "Turkish"
 OCR_LANGS      = ['en']
 READER: easyocr.Reader = None
+READER_LOCK    = threading.Lock()  # one Reader shared by region (F8) and word (F9) threads
 USE_LLM        = CONFIG.get("use_llm", False)
 DETAILED_MODE  = CONFIG.get("detailed_mode", True)
 OPENAI_CLIENT: OpenAI = None
 OPENAI_MODEL   = CONFIG.get("openai_model", "gpt-4o-mini")
+GOOGLE_RPM     = CONFIG.get("google_requests_per_minute", 20)
 
 
 def speak(text: str):
@@ -86,19 +124,81 @@ def speak(text: str):
     threading.Thread(target=_play, daemon=True).start()
 
 
-def word_by_word(text: str, translated: str = "") -> str:
+class TokenBucket:
+    """Thread-safe token bucket: bursts up to `burst` calls, refilling at `rate` per minute."""
+
+    def __init__(self, rate: float, burst: int = 3):
+        self.rate = max(1.0, float(rate))
+        self.burst = max(1, min(int(burst), int(self.rate)))
+        self._tokens = float(self.burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate / 60)
+            self._stamp = now
+            self._tokens -= 1
+            # negative balance = tokens already promised to earlier callers
+            wait = -self._tokens * 60 / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+GOOGLE_LIMITER = TokenBucket(GOOGLE_RPM)
+_GOOGLE_CACHE: OrderedDict = OrderedDict()  # {(text, target): translation}
+_GOOGLE_CACHE_SIZE = 1024
+_GOOGLE_CACHE_LOCK = threading.Lock()
+# GoogleTranslator.translate() writes the query into instance state (_url_params), so
+# instances are reused per thread rather than shared
+_GOOGLE_LOCAL = threading.local()
+
+
+def _google_translator() -> GoogleTranslator:
+    """This thread's GoogleTranslator for TARGET_LANG, created on first use."""
+    translator = getattr(_GOOGLE_LOCAL, "translator", None)
+    if translator is None or getattr(_GOOGLE_LOCAL, "target", None) != TARGET_LANG:
+        translator = GoogleTranslator(source="auto", target=TARGET_LANG)
+        _GOOGLE_LOCAL.translator = translator
+        _GOOGLE_LOCAL.target = TARGET_LANG
+    return translator
+
+
+def google_translate(text: str) -> str:
+    """Google Translate with an LRU cache and GOOGLE_RPM rate limit (free endpoint bans on overuse)."""
+    key = (text, TARGET_LANG)
+    with _GOOGLE_CACHE_LOCK:
+        cached = _GOOGLE_CACHE.get(key)
+        if cached is not None:
+            _GOOGLE_CACHE.move_to_end(key)
+            return cached
+    GOOGLE_LIMITER.acquire()
+    translated = _google_translator().translate(text)
+    if translated:
+        with _GOOGLE_CACHE_LOCK:
+            _GOOGLE_CACHE[key] = translated
+            if len(_GOOGLE_CACHE) > _GOOGLE_CACHE_SIZE:
+                _GOOGLE_CACHE.popitem(last=False)
+    return translated
+
+
+def word_by_word(text: str, translated: str = "") -> Tuple[str, bool]:
     """
-    Word-by-word mapping.
+    Word-by-word mapping, returned as (mapping, complete).
     If LLM is active: single call asking which target word each source word maps to
     (contextual, matches the actual translation).
-    Otherwise: translate each word individually with Google Translate.
+    Otherwise: one google_translate call per word (LRU-cached and rate-limited,
+    so repeated words are free and bursts wait for the quota instead of failing).
+    complete is False when a lookup raised and the mapping is partial or empty.
     """
     if USE_LLM and translated:
         global OPENAI_CLIENT
         if OPENAI_CLIENT is None:
             api_key = CONFIG.get("openai_api_key", "") or os.environ.get("OPENAI_API_KEY", "")
             if not api_key:
-                return ""
+                return "", False
             OPENAI_CLIENT = OpenAI(api_key=api_key)
         prompt = (
             f"Source: \"{text}\"\n"
@@ -113,22 +213,24 @@ def word_by_word(text: str, translated: str = "") -> str:
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0,
             )
-            return response.choices[0].message.content.strip()
+            return response.choices[0].message.content.strip(), True
         except Exception:
-            return ""
+            return "", False
     else:
         words = text.split()[:20]
         parts = []
+        complete = True
         for w in words:
             clean = re.sub(r'[^a-zA-ZÀ-ÿ]', '', w)
             if not clean:
                 continue
             try:
-                t = GoogleTranslator(source="auto", target=TARGET_LANG).translate(clean)
+                t = google_translate(clean)
                 parts.append(f"{clean}→{t}")
             except Exception:
                 parts.append(clean)
-        return '  '.join(parts)
+                complete = False
+        return '  '.join(parts), complete
 
 
 def get_tip(text: str, translated: str) -> str:
@@ -204,20 +306,42 @@ def translate(text: str) -> str:
             if not api_key:
                 return "Error: set openai_api_key in config.json"
             OPENAI_CLIENT = OpenAI(api_key=api_key)
-        response = OPENAI_CLIENT.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": f"Translate to {TARGET_LANG_NAME}. Return only the translation, nothing else."},
-                {"role": "user",   "content": text},
-            ],
-            temperature=0,
-        )
-        return response.choices[0].message.content.strip()
+        return _llm_translate(text, TARGET_LANG_NAME, OPENAI_MODEL)
     else:
-        return GoogleTranslator(source="auto", target=TARGET_LANG).translate(text)
+        return google_translate(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _llm_translate(text: str, target_name: str, model: str) -> str:
+    """LLM translation, memoized on (text, target, model) — temperature 0, so repeats are stable."""
+    response = OPENAI_CLIENT.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": f"Translate to {target_name}. Return only the translation, nothing else."},
+            {"role": "user",   "content": text},
+        ],
+        temperature=0,
+    )
+    return response.choices[0].message.content.strip()
+
 
+def screenshot_to_image(shot) -> Image.Image:
+    """Decode an mss screenshot straight from its BGRA buffer, skipping the `.rgb` copy."""
+    return Image.frombuffer("RGB", (shot.width, shot.height), shot.raw, "raw", "BGRX", 0, 1)
 
-@dataclass
+
+def prepare_for_ocr(img: Image.Image) -> np.ndarray:
+    """
+    Upscale very short captures 2x before OCR: single-line text at native DPI is
+    too small for reliable recognition. The image stays RGB — EasyOCR expands a
+    grayscale array back to BGR for its detector, so greying here saves nothing.
+    """
+    if img.height < 40:
+        img = img.resize((img.width * 2, img.height * 2), Image.LANCZOS)
+    return np.array(img)
+
+
+@dataclass(slots=True)
 class Selection:
     x1: int
     y1: int
@@ -226,7 +350,7 @@ class Selection:
 
 
 # ---------------- Word Translation Classes ---------------- #
-@dataclass
+@dataclass(slots=True)
 class WordInfo:
     """Information about a detected word."""
     text: str
@@ -237,7 +361,34 @@ class WordInfo:
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
+class WordList:
+    """Detected words as parallel arrays (structure of arrays) for vectorized lookups."""
+    texts: List[str]
+    x: np.ndarray
+    y: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    confidence: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "WordList":
+        none = np.empty(0, dtype=np.int64)
+        return cls([], none, none.copy(), none.copy(), none.copy(), np.empty(0, dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, i: int) -> WordInfo:
+        return WordInfo(
+            text=self.texts[i],
+            x=int(self.x[i]), y=int(self.y[i]),
+            width=int(self.width[i]), height=int(self.height[i]),
+            confidence=float(self.confidence[i]),
+        )
+
+
+@dataclass(slots=True)
 class TranslationResult:
     """Result of word translation."""
     original_word: str
@@ -248,6 +399,59 @@ class TranslationResult:
     error_message: Optional[str] = None
 
 
+def _nearest_idx_np(x, y, w, h, cx, cy) -> int:
+    """Index of the box nearest (cx, cy) by squared center distance; a box containing it wins."""
+    dx = x + w // 2 - cx
+    dy = y + h // 2 - cy
+    d2 = dx * dx + dy * dy
+    d2[(x <= cx) & (cx <= x + w) & (y <= cy) & (cy <= y + h)] = 0
+    # argmin returns the first minimum, same tie-break as a strict '<' scan
+    return int(d2.argmin())
+
+
+def _nearest_idx_loop(x, y, w, h, cx, cy):
+    """Scalar version of _nearest_idx_np, compiled with numba when available."""
+    best = 0
+    best_d = -1
+    for i in range(x.shape[0]):
+        if x[i] <= cx <= x[i] + w[i] and y[i] <= cy <= y[i] + h[i]:
+            d = 0
+        else:
+            dx = x[i] + w[i] // 2 - cx
+            dy = y[i] + h[i] // 2 - cy
+            d = dx * dx + dy * dy
+        if best_d < 0 or d < best_d:
+            best = i
+            best_d = d
+    return best
+
+
+_nearest_idx = _nearest_idx_np
+if NUMBA_AVAILABLE:
+    try:
+        # No on-disk cache in a frozen (PyInstaller) build: there is no source file to key it on
+        _nearest_idx = numba.njit(cache=not getattr(sys, "frozen", False))(_nearest_idx_loop)
+    except Exception:
+        NUMBA_AVAILABLE = False
+
+
+def _warm_nearest_idx():
+    """Trigger the numba JIT compile (or cache load) ahead of the first F9 press.
+
+    njit compiles lazily on the first call, so a failure only shows up here; in that
+    case fall back to the NumPy kernel for the rest of the session.
+    """
+    global _nearest_idx, NUMBA_AVAILABLE
+    if not NUMBA_AVAILABLE:
+        return
+    try:
+        one = np.zeros(1, dtype=np.int64)
+        _nearest_idx(one, one, one, one, 0, 0)
+    except Exception:
+        _nearest_idx = _nearest_idx_np
+        NUMBA_AVAILABLE = False
+
+
 class WordDetector:
     """Detects words from OCR data and finds word boundaries."""
     
@@ -255,61 +459,52 @@ class WordDetector:
         self.min_word_length = 2
         self.max_word_length = 50
         self.word_pattern = r'[a-zA-ZÀ-ÿ]+'
+        self._word_re = re.compile(self.word_pattern)
         
-    def extract_words_from_easyocr(self, results: list) -> List[WordInfo]:
+    def extract_words_from_easyocr(self, results: list) -> WordList:
         """Extract word information from EasyOCR results."""
-        words = []
+        has_letter = self._word_re.search
         try:
-            for bbox, text, conf in results:
-                # bbox = [[x1,y1],[x2,y1],[x2,y2],[x1,y2]]
-                x = int(bbox[0][0])
-                y = int(bbox[0][1])
-                width  = int(bbox[1][0]) - x
-                height = int(bbox[2][1]) - y
-                conf_pct = conf * 100
-
-                for word_text in text.split():
-                    word_text = word_text.strip()
-                    if (self.min_word_length <= len(word_text) <= self.max_word_length and
-                            re.search(self.word_pattern, word_text)):
-                        words.append(WordInfo(
-                            text=word_text,
-                            x=x, y=y,
-                            width=width, height=height,
-                            confidence=conf_pct
-                        ))
+            # Flatten boxes into tokens; every token inherits the geometry of its box
+            splits = [text.split() for _, text, _ in results]
+            tokens: List[str] = [tok for split in splits for tok in split]
+            n = len(tokens)
+            if not n:
+                return WordList.empty()
+            nboxes = len(results)
+            owner = np.repeat(np.arange(nboxes), np.fromiter(map(len, splits), dtype=np.intp, count=nboxes))
+            confs = np.fromiter((conf for _, _, conf in results), dtype=np.float64, count=nboxes) * 100
+
+            # Length filter as one mask; the regex only runs on the survivors
+            lens = np.fromiter(map(len, tokens), dtype=np.int32, count=n)
+            keep = (lens >= self.min_word_length) & (lens <= self.max_word_length)
+            idx = [i for i in np.flatnonzero(keep) if has_letter(tokens[i])]
+            if not idx:
+                return WordList.empty()
+
+            # bbox = [[x1,y1],[x2,y1],[x2,y2],[x1,y2]]
+            boxes = np.asarray([bbox for bbox, _, _ in results], dtype=np.float64).astype(np.int64)
+            xs = boxes[:, 0, 0]
+            ys = boxes[:, 0, 1]
+
+            # Gather box attributes per surviving token (fancy indexing copies)
+            o = owner[idx]
+            return WordList(
+                texts=[tokens[i] for i in idx],
+                x=xs[o], y=ys[o],
+                width=boxes[o, 1, 0] - xs[o], height=boxes[o, 2, 1] - ys[o],
+                confidence=confs[o],
+            )
         except Exception as e:
             print(f"Error extracting words from EasyOCR: {e}")
-        return words
+            return WordList.empty()
     
-    def find_nearest_word(self, words: List[WordInfo], cursor_x: int, cursor_y: int) -> Optional[WordInfo]:
+    def find_nearest_word(self, words: WordList, cursor_x: int, cursor_y: int) -> Optional[WordInfo]:
         """Find the word closest to the cursor position."""
         if not words:
             return None
-            
-        min_distance = float('inf')
-        nearest_word = None
-        
-        for word in words:
-            # Calculate distance from cursor to word center
-            word_center_x = word.x + word.width // 2
-            word_center_y = word.y + word.height // 2
-            
-            distance = math.sqrt(
-                (cursor_x - word_center_x) ** 2 + 
-                (cursor_y - word_center_y) ** 2
-            )
-            
-            # Also check if cursor is within word bounds (closer distance)
-            if (word.x <= cursor_x <= word.x + word.width and
-                word.y <= cursor_y <= word.y + word.height):
-                distance = 0  # Cursor is inside the word
-                
-            if distance < min_distance:
-                min_distance = distance
-                nearest_word = word
-                
-        return nearest_word
+        i = _nearest_idx(words.x, words.y, words.width, words.height, int(cursor_x), int(cursor_y))
+        return words[int(i)]
 
 
 class SimpleRegionCapture:
@@ -317,27 +512,47 @@ class SimpleRegionCapture:
     
     def __init__(self):
         self.region_size = 400  # Big area around cursor
+        # mss stores its GDI handles in a threading.local() set up only on the creating
+        # thread, so each grabbing thread lazily gets (and reuses) its own instance
+        self._local = threading.local()
+        # Virtual screen covering all monitors (left/top may be negative); clip against it
+        with mss.mss() as sct:
+            mon = sct.monitors[0]
+        self._bounds = (mon["left"], mon["top"], mon["left"] + mon["width"], mon["top"] + mon["height"])
+
+    def _get_sct(self) -> mss.base.MSSBase:
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = self._local.sct = mss.mss()
+        return sct
+
+    def close(self):
+        """Release the calling thread's mss handle (it can only be closed where it was created)."""
+        sct = getattr(self._local, "sct", None)
+        if sct is not None:
+            sct.close()
+            self._local.sct = None
         
     def capture_big_region_around_cursor(self, cursor_x: int, cursor_y: int) -> Tuple[int, int, int, int, Image.Image]:
         """Capture a big region around cursor and return bounds + image."""
         # Calculate region bounds
         half_size = self.region_size // 2
-        left = max(0, cursor_x - half_size)
-        top = max(0, cursor_y - half_size)
-        right = cursor_x + half_size
-        bottom = cursor_y + half_size
+        min_x, min_y, max_x, max_y = self._bounds
+        left = max(min_x, cursor_x - half_size)
+        top = max(min_y, cursor_y - half_size)
+        right = min(max_x, cursor_x + half_size)
+        bottom = min(max_y, cursor_y + half_size)
         
         try:
             # Capture the region
-            with mss.mss() as sct:
-                monitor = {
-                    "top": top,
-                    "left": left,
-                    "width": right - left,
-                    "height": bottom - top
-                }
-                screenshot = sct.grab(monitor)
-                image = Image.frombytes('RGB', (screenshot.width, screenshot.height), screenshot.rgb)
+            monitor = {
+                "top": top,
+                "left": left,
+                "width": right - left,
+                "height": bottom - top
+            }
+            screenshot = self._get_sct().grab(monitor)
+            image = screenshot_to_image(screenshot)
                 
             return left, top, right, bottom, image
                 
@@ -353,6 +568,22 @@ class WordTranslator:
         self.min_confidence = 30  # Minimum OCR confidence
         self.word_detector = WordDetector()
         self.region_capture = SimpleRegionCapture()
+        # Optional offline word list {word_lower: translation}, checked before the network
+        self._local_dict: dict = self._load_local_dict()
+
+    def close(self):
+        self.region_capture.close()
+
+    @staticmethod
+    def _load_local_dict() -> dict:
+        """Load dict_<src>_<tgt>.json next to main.py (e.g. dict_en_tr.json), if present."""
+        src = 'fr' if 'fr' in OCR_LANGS else 'en'
+        path = os.path.join(os.path.dirname(__file__), f"dict_{src}_{TARGET_LANG}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return {k.lower(): v for k, v in json.load(f).items()}
+        except Exception:
+            return {}
     
     def translate_word_at_cursor(self, cursor_x: int, cursor_y: int) -> TranslationResult:
         """Main method to translate word at cursor position."""
@@ -371,7 +602,8 @@ class WordTranslator:
             
             # Process with OCR
             try:
-                results = READER.readtext(np.array(image))
+                with READER_LOCK:
+                    results = READER.readtext(np.array(image))
                 words = self.word_detector.extract_words_from_easyocr(results)
                 
             except Exception as e:
@@ -394,13 +626,9 @@ class WordTranslator:
                     error_message="No words detected in region"
                 )
             
-            # Adjust word positions to screen coordinates
-            for word in words:
-                word.x += left  # Adjust to screen coordinates
-                word.y += top   # Adjust to screen coordinates
-            
-            # Find nearest word to cursor
-            nearest_word = self.word_detector.find_nearest_word(words, cursor_x, cursor_y)
+            # Find nearest word to cursor — move the cursor into capture coordinates
+            # rather than shifting every word box to screen coordinates
+            nearest_word = self.word_detector.find_nearest_word(words, cursor_x - left, cursor_y - top)
             if nearest_word is None:
                 return TranslationResult(
                     original_word="",
@@ -422,9 +650,11 @@ class WordTranslator:
                     error_message=f"Word confidence too low: {nearest_word.confidence}%"
                 )
             
-            # Translate the word
+            # Translate the word (local dictionary first, then the active backend)
             try:
-                translated = translate(nearest_word.text)
+                translated = self._local_dict.get(nearest_word.text.lower().strip(".,;:!?\"'()«»"))
+                if translated is None:
+                    translated = translate(nearest_word.text)
                 return TranslationResult(
                     original_word=nearest_word.text,
                     translated_word=translated,
@@ -470,23 +700,53 @@ class CaptureController:
         self._custom_region_key = None
         self._custom_word_key   = None
 
+        # Word lookups (OCR + network) run one at a time on a long-lived thread; the
+        # queue is bounded, so an F9 burst drops extra presses rather than piling up
+        # jobs. Region and notify callbacks only post to the UI/Worker and run inline.
+        self._word_q: queue.Queue = queue.Queue(maxsize=4)
+        self._word_cleanup = None
+        self._word_thread = threading.Thread(target=self._drain_words, daemon=True)
+        self._word_thread.start()
+
         self._kb_listener    = keyboard.Listener(on_press=self._on_key_press, on_release=self._on_key_release)
         self._mouse_listener = mouse.Listener(on_click=self._on_mouse_click, on_scroll=self._on_mouse_scroll)
         self._kb_listener.start()
         self._mouse_listener.start()
 
-    def stop(self):
+    def stop(self, cleanup=None):
+        """Stop listening; `cleanup` runs on the word thread once the current lookup is done."""
         self._kb_listener.stop()
         self._mouse_listener.stop()
+        self._word_cleanup = cleanup
+        try:
+            self._word_q.put(None, timeout=1)
+        except queue.Full:
+            return
+        self._word_thread.join(timeout=2)
 
     # ---- helpers ----
 
+    def _drain_words(self):
+        while True:
+            item = self._word_q.get()
+            if item is None:
+                if self._word_cleanup is not None:
+                    try:
+                        self._word_cleanup()
+                    except Exception as e:
+                        print(f"Word thread cleanup error: {e}")
+                return
+            x, y = item
+            try:
+                self.on_word_translate(x, y)
+            except Exception as e:
+                print(f"Word translate error: {e}")
+
     def _notify(self, msg):
-        threading.Thread(target=self.on_wait_for_key, args=(msg,), daemon=True).start()
+        self.on_wait_for_key(msg)
 
     def _do_region(self):
-        import win32gui
-        x, y = win32gui.GetCursorPos()
+        x, y = _get_cursor_pos()
         with self._lock:
             self._points.append((x, y))
             if len(self._points) == 2:
@@ -494,21 +754,22 @@ class CaptureController:
                 x_left, x_right = sorted([x1, x2])
                 y_top, y_bottom  = sorted([y1, y2])
                 sel = Selection(x_left, y_top, x_right, y_bottom)
-                threading.Thread(target=self.on_region_ready, args=(sel,), daemon=True).start()
+                self.on_region_ready(sel)
                 self._points.clear()
 
     def _do_word(self):
-        import win32gui
-        x, y = win32gui.GetCursorPos()
-        threading.Thread(target=self.on_word_translate, args=(x, y), daemon=True).start()
+        x, y = _get_cursor_pos()
+        try:
+            self._word_q.put_nowait((x, y))
+        except queue.Full:
+            self._notify("Busy — still translating previous words, press dropped")
 
     def _do_fullscreen(self):
-        import tkinter as tk
         root = tk.Tk()
         w, h = root.winfo_screenwidth(), root.winfo_screenheight()
         root.destroy()
         sel = Selection(0, 0, w, h)
-        threading.Thread(target=self.on_region_ready, args=(sel,), daemon=True).start()
+        self.on_region_ready(sel)
 
     def _capture_key(self, key_val):
         """Assign key_val to the current waiting mode and notify."""
@@ -611,10 +872,54 @@ class CaptureController:
 
 
 
+_MANY_SPACES_RE = re.compile(r' {4,}')
+_NEWLINES_TO_SPACE = str.maketrans({'\n': ' ', '\r': ' '})
+
+
 class Worker:
     """Background worker to capture, OCR, and translate."""
+    CACHE_SIZE = 128
+
     def __init__(self, ui_callback):
         self.ui_callback = ui_callback
+        # LRU of {(langs, target, backend, detailed, pixel hash): (text, translated, literal)}
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Single-slot, latest-wins: a new selection replaces one that hasn't started yet,
+        # so at most one OCR+translate pipeline runs and bursts collapse to the last region
+        self._latest_sel: queue.Queue = queue.Queue(maxsize=1)
+        self._submit_lock = threading.Lock()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, sel: Optional[Selection]):
+        """Queue a region for processing, dropping any still-pending one. None stops the worker."""
+        with self._submit_lock:
+            try:
+                self._latest_sel.get_nowait()
+            except queue.Empty:
+                pass
+            self._latest_sel.put_nowait(sel)
+
+    def _run(self):
+        # One mss handle for all captures, created here: mss keeps its GDI DCs in a
+        # threading.local() of the creating thread, and this is the only thread that grabs
+        with mss.mss() as sct:
+            while True:
+                sel = self._latest_sel.get()
+                if sel is None:
+                    return
+                try:
+                    self.process(sel, sct)
+                except Exception as e:
+                    print(f"Worker error: {e}")
+
+    def close(self):
+        """Stop the worker thread; it releases its mss handle on the way out."""
+        self.submit(None)
+
+    def _cache_key(self, pixels: bytes) -> tuple:
+        digest = hashlib.blake2b(pixels, digest_size=16).digest()
+        return (tuple(OCR_LANGS), TARGET_LANG, USE_LLM, DETAILED_MODE, digest)
     
     def clean_text(self, text):
         """Clean text by removing newlines and reducing multiple spaces to max 3"""
@@ -622,18 +927,14 @@ class Worker:
             return text
         
         # Remove all newlines and replace with single space
-        text = text.replace('\n', ' ').replace('\r', ' ')
+        text = text.translate(_NEWLINES_TO_SPACE)
         
-        # Replace multiple spaces with maximum 3 spaces
-        import re
-        text = re.sub(r' {4,}', '   ', text)  # Replace 4+ spaces with 3 spaces
-        
-        # Clean up any remaining multiple spaces (but keep up to 3)
-        text = re.sub(r' {2,3}', lambda m: ' ' * min(len(m.group()), 3), text)
+        # Replace 4+ spaces with 3 spaces (runs of 2-3 are already within the limit)
+        text = _MANY_SPACES_RE.sub('   ', text)
         
         return text.strip()
 
-    def process(self, sel: Selection):
+    def process(self, sel: Selection, sct: mss.base.MSSBase):
         x1, y1, x2, y2 = sel.x1, sel.y1, sel.x2, sel.y2
         
         # Ensure valid coordinates
@@ -643,26 +944,38 @@ class Worker:
         
         # Try MSS capture first (most reliable)
         try:
-            with mss.mss() as sct:
-                monitor = {
-                    "top": y1,
-                    "left": x1,
-                    "width": x2 - x1,
-                    "height": y2 - y1
-                }
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes('RGB', (screenshot.width, screenshot.height), screenshot.rgb)
+            monitor = {
+                "top": y1,
+                "left": x1,
+                "width": x2 - x1,
+                "height": y2 - y1
+            }
+            screenshot = sct.grab(monitor)
+            pixels = screenshot.raw
+            img = screenshot_to_image(screenshot)
         except Exception:
             # Fallback to ImageGrab
             try:
                 img = ImageGrab.grab(bbox=(x1, y1, x2, y2))
+                pixels = img.tobytes()
             except Exception:
                 self.ui_callback("Capture failed", "Could not capture screen region")
                 return
+
+        # Same pixels + same settings → skip OCR and translation entirely
+        key = self._cache_key(pixels)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            self.ui_callback(*cached)
+            return
         
         # OCR
         try:
-            results = READER.readtext(np.array(img))
+            with READER_LOCK:
+                results = READER.readtext(prepare_for_ocr(img))
             text = ' '.join(r[1] for r in results).strip()
         except Exception as e:
             text = f"OCR Error: {e}"
@@ -672,28 +985,42 @@ class Worker:
 
         # Translate
         translated = ""
+        # Only complete results are cached; errors and degraded output are transient
+        cacheable = not text.startswith("OCR Error")
         if text and not text.startswith("OCR Error"):
+            # Show the original right away; translation (network) follows
+            self.ui_callback(text, None)
             try:
-                translated = self.clean_text(translate(text))
+                translated = self.clean_text(translate(text)) or ""
             except Exception as e:
                 translated = f"Translation Error: {e}"
+            cacheable = bool(translated) and not translated.startswith("Translation Error")
             literal = ""
+            complete = False
             try:
-                literal = word_by_word(text, translated)
+                literal, complete = word_by_word(text, translated)
             except Exception:
                 pass
+            cacheable = cacheable and complete
             tip = ""
             if USE_LLM and DETAILED_MODE:
                 try:
                     tip = get_tip(text, translated)
                 except Exception:
                     pass
+                cacheable = cacheable and bool(tip)
             if tip:
                 literal = f"{literal}\n{tip}" if literal else tip
         else:
             translated = "No text detected"
             literal = ""
 
+        if cacheable:
+            with self._cache_lock:
+                self._cache[key] = (text, translated, literal)
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
         self.ui_callback(text, translated, literal)
 
 
@@ -802,6 +1129,7 @@ class SimpleApp(tk.Tk):
         self._current_original = ""
         self._drag_started = False
         self._selected_word: tuple = None  # (word, meaning)
+        self._last_text = None  # content currently shown in text_widget
 
         # Add drag functionality to all widgets
         for w in (self, self.text_widget, self.history_widget, self.history_frame):
@@ -821,13 +1149,12 @@ class SimpleApp(tk.Tk):
         # Initial message
         src_label = "FR" if 'fr' in OCR_LANGS else "EN"
         lang_label = f"{src_label}→{TARGET_LANG.upper()}"
-        self.text_widget.config(state=tk.NORMAL)
         backend = "LLM" if USE_LLM else "Google"
-        self.text_widget.insert(tk.END, f"[{lang_label}] [{backend}] F8=region  F9=word  Ctrl+F8=remap region  Ctrl+F9=remap word  Ctrl+L=toggle translation(LLM/Google)  RClick=close")
-        self.text_widget.config(state=tk.DISABLED)
+        self._set_text(f"[{lang_label}] [{backend}] F8=region  F9=word  Ctrl+F8=remap region  Ctrl+F9=remap word  Ctrl+L=toggle translation(LLM/Google)  RClick=close")
         
-        # Worker & controller
-        self.worker = Worker(self._on_result)
+        # Worker & controller — callbacks arrive on background threads, so every
+        # UI update is posted to the Tk main loop with after() (Tk is not thread-safe)
+        self.worker = Worker(lambda *args: self.after(0, self._on_result, *args))
         self.word_translator = WordTranslator()
         self.controller = CaptureController(self._on_region_ready, self._on_word_translate, self._on_wait_for_key)
 
@@ -841,6 +1168,25 @@ class SimpleApp(tk.Tk):
         if self.word_history:
             self._refresh_history()
 
+        # Pay OCR/translator first-call costs while the user is still aiming
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Compile the nearest-word kernel (numba JIT), run one tiny OCR pass (CUDA kernels,
+        cuDNN autotune) and one Google call (TLS, parser)."""
+        _warm_nearest_idx()
+        try:
+            if READER is not None:
+                with READER_LOCK:
+                    READER.readtext(np.full((32, 32), 255, dtype=np.uint8))
+        except Exception:
+            pass
+        if not USE_LLM:
+            try:
+                google_translate("hello")
+            except Exception:
+                pass
+
     def start_move(self, event):
         self.x = event.x
         self.y = event.y
@@ -855,29 +1201,32 @@ class SimpleApp(tk.Tk):
         self.geometry(f"+{x}+{y}")
 
     def _on_region_ready(self, sel: Selection):
+        self.after(0, self._set_text, "Processing region...")
+        self.worker.submit(sel)
+
+    def _set_text(self, content: str):
+        """Swap text_widget content in one replace() — skipped if nothing changed."""
+        if content == self._last_text:
+            return
+        self._last_text = content
         self.text_widget.config(state=tk.NORMAL)  # Enable editing
-        self.text_widget.delete("1.0", tk.END)
-        self.text_widget.insert(tk.END, "Processing region...")
+        self.text_widget.replace("1.0", tk.END, content)
         self.text_widget.config(state=tk.DISABLED)  # Disable editing again
-        self.worker.process(sel)
 
     def _on_word_translate(self, cursor_x: int, cursor_y: int):
-        """Handle word translation at cursor position."""
-        self.text_widget.config(state=tk.NORMAL)  # Enable editing
-        self.text_widget.delete("1.0", tk.END)
-        self.text_widget.insert(tk.END, "Finding word at cursor...")
-        self.text_widget.config(state=tk.DISABLED)  # Disable editing again
+        """Handle word translation at cursor position (runs on the controller's word thread)."""
+        self.after(0, self._set_text, "Finding word at cursor...")
         
-        # Perform word translation
+        # Perform word translation (and the LLM tip) here, off the Tk main loop
         result = self.word_translator.translate_word_at_cursor(cursor_x, cursor_y)
-        self._on_word_result(result)
+        tip = ""
+        if result.success and USE_LLM and DETAILED_MODE:
+            tip = get_tip(result.original_word, result.translated_word)
+        self.after(0, self._on_word_result, result, tip)
 
-    def _on_word_result(self, result: TranslationResult):
+    def _on_word_result(self, result: TranslationResult, tip: str = ""):
         """Handle word translation result (F9 cursor word)."""
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.delete("1.0", tk.END)
         if result.success:
-            tip = get_tip(result.original_word, result.translated_word) if (USE_LLM and DETAILED_MODE) else ""
             parts = [result.original_word, result.translated_word]
             if tip:
                 parts.append(tip)
@@ -885,8 +1234,7 @@ class SimpleApp(tk.Tk):
 
         else:
             result_text = f"Kelime çevirilemedi: {result.error_message}"
-        self.text_widget.insert(tk.END, result_text)
-        self.text_widget.config(state=tk.DISABLED)
+        self._set_text(result_text)
         self.after(0, self._fit_translation)
 
     def _load_history(self) -> dict:
@@ -950,7 +1298,6 @@ class SimpleApp(tk.Tk):
         cols = max(1, win_width // ((col_width + 2) * char_width))
         self._history_col_width = col_width
 
-        import math
         rows = math.ceil(len(entries) / cols) if entries else 0
         self.history_widget.config(state=tk.NORMAL)
         self.history_widget.delete("1.0", tk.END)
@@ -964,22 +1311,11 @@ class SimpleApp(tk.Tk):
         global USE_LLM
         USE_LLM = not USE_LLM
         mode = f"OpenAI ({OPENAI_MODEL})" if USE_LLM else "Google Translate"
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.delete("1.0", tk.END)
-        self.text_widget.insert(tk.END, f"Translation backend: {mode}")
-        self.text_widget.config(state=tk.DISABLED)
+        self._set_text(f"Translation backend: {mode}")
 
     def _on_wait_for_key(self, message=None):
-        """Handle wait-for-key mode activation."""
-        self.text_widget.config(state=tk.NORMAL)  # Enable editing
-        self.text_widget.delete("1.0", tk.END)
-        
-        if message:
-            self.text_widget.insert(tk.END, message)
-        else:
-            self.text_widget.insert(tk.END, "Waiting for key... Press any key to set it as translation key")
-        
-        self.text_widget.config(state=tk.DISABLED)  # Disable editing again
+        """Handle wait-for-key mode activation (called from a pynput listener thread)."""
+        self.after(0, self._set_text, message or "Waiting for key... Press any key to set it as translation key")
 
     def _fit_translation(self):
         """Resize text_widget and window height to fit actual rendered content."""
@@ -1041,21 +1377,22 @@ class SimpleApp(tk.Tk):
         except Exception:
             pass
 
-    def _on_result(self, original: str, translated: str, literal: str = ""):
+    def _on_result(self, original: str, translated: Optional[str], literal: str = ""):
+        """Render a region result; translated=None means OCR is done and translation is pending."""
         self._current_original = original or ""
         self._word_meanings = {}
         self.word_meaning_label.config(text="")
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.delete("1.0", tk.END)
         line1 = original or "(no text detected)"
-        line2 = translated or "(translation failed)"
+        if translated is None:
+            line2 = "(translating...)"
+        else:
+            line2 = translated or "(translation failed)"
         result = f"{line1}\n{line2}"
         if literal:
             result += f"\n{literal}"
-        self.text_widget.insert(tk.END, result)
-        self.text_widget.config(state=tk.DISABLED)
+        self._set_text(result)
         self.after(0, self._fit_translation)
-        if USE_LLM and original:
+        if USE_LLM and original and translated is not None:
             threading.Thread(target=self._prefetch_meanings, args=(original,), daemon=True).start()
 
     def _prefetch_meanings(self, sentence: str):
@@ -1064,7 +1401,13 @@ class SimpleApp(tk.Tk):
 
     def _on_close(self, event=None):
         try:
-            self.controller.stop()
+            # F9 captures grab on the controller's word thread, so close their mss handle there
+            self.controller.stop(cleanup=self.word_translator.close)
+        except Exception:
+            pass
+        try:
+            self.worker.close()
+            HTTP_SESSION.close()
         except Exception:
             pass
         self.destroy()